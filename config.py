@@ -239,5 +239,5 @@ def get_theme(theme_name):
 # Wallpaper settings
 WALLPAPER_CONFIG = {
     "output_filename": "wallpaper_with_calendar.png",
-    "quality": 95,
+    "compress_level": 1,  # PNG zlib level: 1 = fast save, 9 = smallest file
 }
@@ -1,14 +1,20 @@
 """
 Wallpaper Generator - Premium Edition
-Features: 4x Supersampled Text, Glassmorphism/Solid modes, Resolution-Independent Scaling
+Features: Supersampled Large Text, Glassmorphism/Solid modes, Resolution-Independent Scaling
 """
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from bisect import bisect_left
 import calendar
+import colorsys
+import threading
+import zlib
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import numpy as np
 
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
+from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageStat
 
 from config import (
     THEMES, CATEGORY_COLORS, CALENDAR_STYLES, WALLPAPER_CONFIG, OUTPUT_DIR,
@@ -21,6 +27,7 @@ from config import (
 # ============================================================================
 
 SUPERSAMPLE_SCALE = 4  # 4x for smooth antialiasing
+SUPERSAMPLE_MIN_SIZE = 80  # Below this FreeType's own grayscale AA is as good
 FONT_BASE_MULTIPLIER = 2.5  # Base boost for all fonts
 
 
@@ -79,8 +86,24 @@ def get_auto_contrast_color(background_image: Image.Image) -> Tuple[tuple, tuple
     return primary, secondary, shadow
 
 
+_font_paths = {}  # bold -> first font path that loaded, or None if none did
+_default_font = None  # Shared load_default() fallback, loaded once
+
+
+@lru_cache(maxsize=128)
 def get_font(size: int, bold: bool = True) -> ImageFont.FreeTypeFont:
-    """Get system font with strict fallback to ensure TrueType scaling."""
+    """
+    Get system font with strict fallback to ensure TrueType scaling.
+    
+    Fonts are cached per (size, bold) and shared - FreeTypeFont is not
+    mutated by drawing. The working path is remembered, so new sizes skip
+    the failed probes; a weight with no usable font warns once, then goes
+    straight to the default font.
+    """
+    global _default_font
+    if bold in _font_paths and _font_paths[bold] is None:
+        return _default_font
+    
     # Standard Windows font paths
     search_paths = [
         r"C:\Windows\Fonts\segoeui.ttf" if not bold else r"C:\Windows\Fonts\segoeuib.ttf",
@@ -89,61 +112,90 @@ def get_font(size: int, bold: bool = True) -> ImageFont.FreeTypeFont:
         "arial.ttf",
         "segoeui.ttf"
     ]
+    if _font_paths.get(bold):
+        search_paths.insert(0, _font_paths[bold])
     
     for font_path in search_paths:
         try:
-            return ImageFont.truetype(font_path, size)
+            font = ImageFont.truetype(font_path, size)
         except OSError:
             continue
+        _font_paths[bold] = font_path
+        return font
             
     # CRITICAL FALLBACK: Warning if we hit this, text will be tiny/pixelated
     print(f"WARNING: Could not load any TrueType fonts. Text will be tiny. Size requested: {size}")
-    return ImageFont.load_default()
+    # Load the fallback before publishing the None marker: widgets render on
+    # a thread pool, and the early return above must never see it unset
+    if _default_font is None:
+        _default_font = ImageFont.load_default()
+    _font_paths[bold] = None
+    return _default_font
 
 
 def render_smooth_text(text: str, font_size: int, color: tuple,
                        bold: bool = True, shadow_color: tuple = None,
                        shadow_offset: int = 2) -> Image.Image:
     """
-    Render text at 4x resolution then downsample for smooth antialiasing.
+    Render text with smooth antialiasing. Sizes of SUPERSAMPLE_MIN_SIZE and
+    up are drawn at SUPERSAMPLE_SCALE x and downsampled; smaller text is drawn
+    directly, where FreeType's own antialiasing is just as good.
     Returns transparent RGBA image cropped to text bounds.
-    """
-    font_size = max(12, font_size)
     
-    # Render at 4x for smooth AA
-    large_size = font_size * SUPERSAMPLE_SCALE
+    Results are memoized (labels, weekday letters and day numbers repeat on
+    every regeneration); callers get their own copy so they may mutate it.
+    """
+    return _render_smooth_text_cached(text, max(12, font_size), tuple(color), bold,
+                                      tuple(shadow_color) if shadow_color else None,
+                                      shadow_offset).copy()
+
+
+@lru_cache(maxsize=256)
+def _render_smooth_text_cached(text: str, font_size: int, color: tuple,
+                               bold: bool, shadow_color: Optional[tuple],
+                               shadow_offset: int) -> Image.Image:
+    """Rasterizer behind render_smooth_text - never hand out the cached image itself."""
+    # Supersample large text only (small text: draw directly, 16x fewer pixels)
+    ss = SUPERSAMPLE_SCALE if font_size >= SUPERSAMPLE_MIN_SIZE else 1
+    large_size = font_size * ss
     font = get_font(large_size, bold)
     
-    # Measure text
-    temp_img = Image.new('RGBA', (1, 1), (0, 0, 0, 0))
-    temp_draw = ImageDraw.Draw(temp_img)
-    bbox = temp_draw.textbbox((0, 0), text, font=font)
+    # Measure text (straight from the font - no scratch image)
+    bbox = font.getbbox(text)
     
-    text_w = bbox[2] - bbox[0] + shadow_offset * SUPERSAMPLE_SCALE * 2
-    text_h = bbox[3] - bbox[1] + shadow_offset * SUPERSAMPLE_SCALE * 2
+    text_w = bbox[2] - bbox[0] + shadow_offset * ss * 2
+    text_h = bbox[3] - bbox[1] + shadow_offset * ss * 2
     
-    # Draw at 4x size
+    # Draw at the supersampled size
     large_img = Image.new('RGBA', (text_w + 20, text_h + 20), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(large_img)
     
-    x = -bbox[0] + shadow_offset * SUPERSAMPLE_SCALE
-    y = -bbox[1] + shadow_offset * SUPERSAMPLE_SCALE
+    x = -bbox[0] + shadow_offset * ss
+    y = -bbox[1] + shadow_offset * ss
+    
+    # Rasterize the glyphs once as a coverage mask; shadow copies and the
+    # main text are flat color fills through it (what draw.text does anyway)
+    glyphs = Image.new('L', large_img.size, 0)
+    ImageDraw.Draw(glyphs).text((x, y), text, font=font, fill=255)
     
     # Shadow
     if shadow_color:
-        scaled_offset = shadow_offset * SUPERSAMPLE_SCALE
+        scaled_offset = shadow_offset * ss
         for dx, dy in [(-scaled_offset, 0), (scaled_offset, 0), 
                        (0, -scaled_offset), (0, scaled_offset)]:
-            draw.text((x + dx, y + dy), text, font=font, fill=shadow_color)
+            large_img.paste(shadow_color, (dx, dy), glyphs)
     
     # Main text
-    draw.text((x, y), text, font=font, fill=color)
+    large_img.paste(color, (0, 0), glyphs)
+    
+    if ss == 1:
+        return large_img.crop((0, 0, text_w + 5, text_h + 5))
     
-    # Downsample with LANCZOS
-    final_w = max(1, text_w // SUPERSAMPLE_SCALE)
-    final_h = max(1, text_h // SUPERSAMPLE_SCALE)
+    # Downsample - a 4x bilinear (triangle) reduction is already a full AA
+    # filter; LANCZOS costs twice as much for edges within a few alpha levels
+    final_w = max(1, text_w // ss)
+    final_h = max(1, text_h // ss)
     
-    return large_img.resize((final_w + 5, final_h + 5), Image.Resampling.LANCZOS)
+    return large_img.resize((final_w + 5, final_h + 5), Image.Resampling.BILINEAR)
 
 
 def draw_dynamic_text(target: Image.Image, pos: tuple, text: str,
@@ -195,11 +247,50 @@ def draw_dynamic_text(target: Image.Image, pos: tuple, text: str,
     return font_size  # Return for layout calculations
 
 
+@lru_cache(maxsize=256)
+def _text_tile(text: str, font_size: int, color: tuple, bold: bool = False) -> Image.Image:
+    """
+    Short label (e.g. a day number) rasterized once into an RGBA tile
+    cropped to its ink box. The calendar grid repeats the same 31 labels in
+    a handful of colors, so tiles are shared - composite, never mutate.
+    """
+    font = get_font(font_size, bold)
+    left, top, right, bottom = font.getbbox(text)
+    tile = Image.new('RGBA', (max(1, right - left), max(1, bottom - top)), (*color[:3], 0))
+    ImageDraw.Draw(tile).text((-left, -top), text, font=font, fill=color)
+    return tile
+
+
+@lru_cache(maxsize=256)
+def fit_text(text: str, font_size: int, max_width: int, bold: bool = False) -> str:
+    """
+    Truncate text with ".." so it measures at most max_width pixels.
+    Bisects on font.getlength (advance widths, no rasterizing).
+    """
+    font = get_font(font_size, bold)
+    if font.getlength(text) <= max_width:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if font.getlength(text[:mid] + "..") <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + ".."
+
+
 
 # ============================================================================
 # DPI-AWARE SCALING
 # ============================================================================
 
+# Widget width factor by aspect ratio: above ASPECT_THRESHOLDS[i] (and at
+# most the next one) uses WIDTH_FACTORS[i + 1]; wider screens get narrower widgets
+ASPECT_THRESHOLDS = (1.5, 1.7, 2.0)
+WIDTH_FACTORS = (0.18, 0.15, 0.12, 0.10)
+
+
 def calculate_dpi_scale(image_width: int, image_height: int) -> dict:
     """Calculate scaling factors based on image resolution."""
     REF_WIDTH = 1920
@@ -208,14 +299,7 @@ def calculate_dpi_scale(image_width: int, image_height: int) -> dict:
     dpi_scale = min(image_width / REF_WIDTH, 2.0)
     dpi_scale = max(0.8, dpi_scale)
     
-    if aspect_ratio > 2.0:
-        width_factor = 0.10
-    elif aspect_ratio > 1.7:
-        width_factor = 0.12
-    elif aspect_ratio > 1.5:
-        width_factor = 0.15
-    else:
-        width_factor = 0.18
+    width_factor = WIDTH_FACTORS[bisect_left(ASPECT_THRESHOLDS, aspect_ratio)]
     
     return {
         'dpi_scale': dpi_scale,
@@ -227,9 +311,11 @@ def calculate_dpi_scale(image_width: int, image_height: int) -> dict:
 
 
 def calculate_widget_size(image_width: int, image_height: int,
-                          widget_type: str, user_size_percent: int = 25) -> Tuple[int, int]:
-    """Calculate optimal widget dimensions."""
-    scale = calculate_dpi_scale(image_width, image_height)
+                          widget_type: str, user_size_percent: int = 25,
+                          scale: dict = None) -> Tuple[int, int]:
+    """Calculate optimal widget dimensions. Pass `scale` to reuse a calculate_dpi_scale() result."""
+    if scale is None:
+        scale = calculate_dpi_scale(image_width, image_height)
     size_mult = 0.7 + (user_size_percent - 15) / 50
     
     if widget_type == 'calendar':
@@ -312,37 +398,145 @@ def calculate_font_size(widget_width: int, widget_height: int,
 # WIDGET BACKGROUNDS: GLASS vs SOLID
 # ============================================================================
 
+_MASK_CACHE_SIZE = 16  # Widget sizes rarely change between regenerations
+_mask_cache: Dict[Tuple[int, int, int], Image.Image] = {}
+_mask_lock = threading.Lock()  # Widgets render on worker threads
+
+
+def _rounded_mask(width: int, height: int, border_radius: int) -> Image.Image:
+    """
+    Get a rounded-rectangle L mask, cached by (width, height, border_radius).
+    The returned mask is shared - only use it as a read-only mask.
+    """
+    key = (width, height, border_radius)
+    with _mask_lock:
+        mask = _mask_cache.get(key)
+        if mask is None:
+            mask = Image.new('L', (width, height), 0)
+            ImageDraw.Draw(mask).rounded_rectangle([0, 0, width, height], radius=border_radius, fill=255)
+            
+            # Simple FIFO bound so odd sizes don't accumulate forever
+            if len(_mask_cache) >= _MASK_CACHE_SIZE:
+                del _mask_cache[next(iter(_mask_cache))]
+            _mask_cache[key] = mask
+    return mask
+
+
+_GLASS_CACHE_SIZE = 8  # Finished glass panels - one per widget, with room for a layout change
+_glass_cache: Dict[tuple, Image.Image] = {}
+_glass_lock = threading.Lock()
+
+
+BOX_BLUR_PASSES = 2  # Two variance-matched box passes read as Gaussian on frosted glass
+BLUR_DOWNSCALE = 4  # Blur at 1/4 size; frosted glass has no high frequencies to lose
+
+
+def _box_blur(image: Image.Image, radius: float) -> Image.Image:
+    """
+    Approximate GaussianBlur(radius) with repeated box blurs.
+    Box radius is picked so the passes match the Gaussian's variance.
+    """
+    box_w = (12 * radius ** 2 / BOX_BLUR_PASSES + 1) ** 0.5
+    box_filter = ImageFilter.BoxBlur((box_w - 1) / 2)
+    
+    for _ in range(BOX_BLUR_PASSES):
+        image = image.filter(box_filter)
+    return image
+
+
+GLASS_CONTRAST = 1.05
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)  # ITU-R 601, as used by convert('L')
+
+
+def _glass_color_matrix(mean_luminance: float, brightness: float, saturation: float,
+                        tint_color: Optional[tuple], tint_strength: float) -> tuple:
+    """
+    Brightness, Color (saturation), Contrast and tint as one affine RGB
+    transform for Image.convert(matrix=...).
+    
+    Each step is linear in RGB (Color keeps luminance, Contrast pivots on
+    the mean gray), so together they are out = A @ rgb + offset and the
+    image is read and written once instead of four times.
+    """
+    if tint_color:
+        keep, tint = 1.0 - tint_strength, [c * tint_strength for c in tint_color]
+    else:
+        keep, tint = 1.0, [0.0, 0.0, 0.0]
+    gain = keep * GLASS_CONTRAST * brightness
+    pivot = keep * (1.0 - GLASS_CONTRAST) * mean_luminance * brightness
+    
+    matrix = []
+    for i in range(3):
+        for j in range(3):
+            matrix.append(gain * (saturation * (i == j) + (1.0 - saturation) * LUMA_WEIGHTS[j]))
+        matrix.append(pivot + tint[i])
+    return tuple(matrix)
+
+
 def apply_glassmorphism(base_image: Image.Image, region: tuple,
                         blur_radius: int = 25, brightness: float = 1.0,
                         saturation: float = 1.1, tint_color: tuple = None,
-                        tint_strength: float = 0.15, border_radius: int = 18) -> Image.Image:
-    """True frosted glass effect."""
+                        tint_strength: float = 0.15, border_radius: int = 18,
+                        source_key: tuple = None) -> Image.Image:
+    """
+    True frosted glass effect.
+    
+    Pass `source_key` (something that changes whenever base_image's pixels
+    do, e.g. path + mtime) to reuse the panel from an earlier call - a
+    clock-tick regeneration then only re-blurs what actually moved.
+    """
+    key = None
+    if source_key is not None:
+        key = (source_key, tuple(region), blur_radius, brightness, saturation,
+               tint_color, tint_strength, border_radius)
+        with _glass_lock:
+            cached = _glass_cache.get(key)
+        if cached is not None:
+            return cached.copy()  # Callers draw on the panel
+    
     x1, y1, x2, y2 = region
     w, h = x2 - x1, y2 - y1
     
-    cropped = base_image.crop(region).convert('RGBA')
-    blurred = cropped.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+    # Downscale -> blur -> upscale: 16x fewer pixels through the blur and
+    # every color pass below; the bilinear upscale hides the small grid.
+    # reduce(box=) reads the region in place - no full-size crop copy - but
+    # only accepts boxes inside the image; crop() pads widgets hanging off it.
+    factor = BLUR_DOWNSCALE if blur_radius >= 2 * BLUR_DOWNSCALE else 1
+    if factor > 1 and _region_inside(base_image, region):
+        cropped = base_image.reduce(factor, box=region)
+    elif factor > 1:
+        cropped = base_image.crop(region).reduce(factor)
+    else:
+        cropped = base_image.crop(region)
+    
+    # Stay in RGB until the alpha mask is applied - 25% fewer bytes per pass
+    if cropped.mode != 'RGB':
+        cropped = cropped.convert('RGB')
+    blurred = _box_blur(cropped, blur_radius / factor)
     
-    if brightness != 1.0:
-        blurred = ImageEnhance.Brightness(blurred).enhance(brightness)
-    if saturation != 1.0:
-        blurred = ImageEnhance.Color(blurred).enhance(saturation)
-    blurred = ImageEnhance.Contrast(blurred).enhance(1.05)
+    # Brightness/saturation/contrast/tint in one fused pass; they are
+    # per-pixel (contrast uses the global mean), so they commute with the upscale
+    mean_luminance = ImageStat.Stat(blurred.convert('L')).mean[0]
+    blurred = blurred.convert('RGB', _glass_color_matrix(mean_luminance, brightness, saturation,
+                                                         tint_color, tint_strength))
     
-    if tint_color:
-        tint = Image.new('RGBA', (w, h), (*tint_color, int(255 * tint_strength)))
-        blurred = Image.alpha_composite(blurred, tint)
+    if blurred.size != (w, h):
+        blurred = blurred.resize((w, h), Image.Resampling.BILINEAR)
     
     # Border highlight
     draw = ImageDraw.Draw(blurred)
     draw.rounded_rectangle([0, 0, w-1, h-1], radius=border_radius,
                            outline=(255, 255, 255, 25), width=1)
     
-    # Rounded mask
-    mask = Image.new('L', (w, h), 0)
-    ImageDraw.Draw(mask).rounded_rectangle([0, 0, w, h], radius=border_radius, fill=255)
-    blurred.putalpha(mask)
+    # Rounded mask (promotes to RGBA)
+    blurred.putalpha(_rounded_mask(w, h, border_radius))
     
+    if key is not None:
+        with _glass_lock:
+            if len(_glass_cache) >= _GLASS_CACHE_SIZE:
+                del _glass_cache[next(iter(_glass_cache))]
+            _glass_cache[key] = blurred
+        return blurred.copy()
     return blurred
 
 
@@ -350,29 +544,111 @@ def apply_solid_background(width: int, height: int, theme: dict,
                            opacity: int = 220, border_radius: int = 18) -> Image.Image:
     """Old-style solid color background."""
     bg_color = (*theme['bg_color'], opacity)
+    border_color = (*theme.get('border_color', theme['bg_color']), 80)
     
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    # Square corners: a flat fill, no mask needed
+    if border_radius <= 0:
+        img = Image.new('RGBA', (width, height), bg_color)
+        ImageDraw.Draw(img).rectangle([0, 0, width-1, height-1], outline=border_color, width=1)
+        return img
+    
+    # Fill with the final color, then drop in the cached rounded mask
+    # (scaled to the opacity) as alpha - one memset and one channel copy,
+    # instead of clearing the buffer and blending the fill through the mask
+    img = Image.new('RGBA', (width, height), bg_color)
+    mask = _rounded_mask(width, height, border_radius)
+    if opacity < 255:
+        mask = mask.point([v * opacity // 255 for v in range(256)])
+    img.putalpha(mask)
+    
+    # Subtle border - the only per-call rasterization, touches ~2*(w+h) pixels
+    ImageDraw.Draw(img).rounded_rectangle([0, 0, width-1, height-1], radius=border_radius,
+                                          outline=border_color, width=1)
     
-    draw.rounded_rectangle([0, 0, width, height], radius=border_radius, fill=bg_color)
+    return img
+
+
+ANALYSIS_SIZE = 256  # Downsampled size used to analyze all widget regions at once
+
+
+def analyze_regions(image: Image.Image, regions: Dict[str, tuple]) -> Dict[str, dict]:
+    """
+    Compute luminance and dominant color for several regions in one pass.
     
-    # Subtle border
-    border_color = (*theme.get('border_color', theme['bg_color']), 80)
-    draw.rounded_rectangle([0, 0, width-1, height-1], radius=border_radius,
-                           outline=border_color, width=1)
+    The image is downsampled once and each region becomes a slice of that
+    array, instead of a full-resolution crop + reduction per widget.
     
-    return img
+    Args:
+        image: Base wallpaper image
+        regions: {name: (x1, y1, x2, y2)} in full-resolution pixels
+    
+    Returns:
+        {name: {'luminance': 0-255 float, 'dominant': (r, g, b)}}
+    """
+    if not regions:
+        return {}
+    
+    img_w, img_h = image.size
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    # BOX is an exact area average - the right filter for region means, and
+    # about twice as fast as BILINEAR on a 4K source
+    small = image.resize((ANALYSIS_SIZE, ANALYSIS_SIZE), Image.Resampling.BOX)
+    arr = np.asarray(small, dtype=np.float32)
+    sx, sy = ANALYSIS_SIZE / img_w, ANALYSIS_SIZE / img_h
+    
+    result = {}
+    for name, (x1, y1, x2, y2) in regions.items():
+        sx1, sy1 = int(x1 * sx), int(y1 * sy)
+        sx2 = max(sx1 + 1, int(np.ceil(x2 * sx)))
+        sy2 = max(sy1 + 1, int(np.ceil(y2 * sy)))
+        
+        r, g, b = arr[sy1:sy2, sx1:sx2].mean(axis=(0, 1))
+        result[name] = {
+            'luminance': float(0.299 * r + 0.587 * g + 0.114 * b),
+            'dominant': (int(r), int(g), int(b)),
+        }
+    return result
 
 
-def get_optimal_glass_params(image: Image.Image, region: tuple) -> dict:
-    """Analyze region for optimal glass effect."""
-    cropped = image.crop(region).convert('L')
-    brightness = np.mean(np.array(cropped)) / 255.0
+def _region_inside(image: Image.Image, region: tuple) -> bool:
+    """True if region lies within the image. Pillow's box= arguments reject
+    anything else, while crop() pads - widgets can hang off small images."""
+    x1, y1, x2, y2 = region
+    return x1 >= 0 and y1 >= 0 and x2 <= image.width and y2 <= image.height
+
+
+def get_region_stats(image: Image.Image, region: tuple) -> dict:
+    """
+    Luminance/dominant color for a single region at full resolution.
+    Same result shape as analyze_regions().
+    """
+    # A 1x1 BOX resize is the exact region mean, computed in C; with box=
+    # it reads the region in place, so RGB sources need no crop copy.
+    # Luminance uses the same ITU-R 601 weights as PIL's convert('L').
+    if image.mode == 'RGB' and _region_inside(image, region):
+        pixel = image.resize((1, 1), Image.Resampling.BOX, box=region)
+    else:
+        pixel = image.crop(region).convert('RGB').resize((1, 1), Image.Resampling.BOX)
+    r, g, b = pixel.getpixel((0, 0))
+    return {
+        'luminance': 0.299 * r + 0.587 * g + 0.114 * b,
+        'dominant': (int(r), int(g), int(b)),
+    }
+
+
+def get_optimal_glass_params(luminance: float) -> dict:
+    """
+    Pick glass effect parameters for a region.
+    
+    Args:
+        luminance: Mean region luminance on the 0-255 scale (as from analyze_regions)
+    """
     
-    if brightness < 0.35:
+    if luminance < 90:
         return {'blur_radius': 28, 'brightness': 1.3, 'saturation': 1.2,
                 'tint_color': (220, 220, 230), 'tint_strength': 0.12}
-    elif brightness > 0.65:
+    elif luminance > 165:
         return {'blur_radius': 25, 'brightness': 0.75, 'saturation': 1.1,
                 'tint_color': (30, 30, 40), 'tint_strength': 0.18}
     else:
@@ -380,14 +656,15 @@ def get_optimal_glass_params(image: Image.Image, region: tuple) -> dict:
                 'tint_color': (255, 255, 255), 'tint_strength': 0.12}
 
 
-def get_adaptive_colors(image: Image.Image, region: tuple, use_glass: bool = True) -> dict:
+def get_adaptive_colors(image: Image.Image, region: tuple, use_glass: bool = True,
+                        precomputed: dict = None) -> dict:
     """
     Get optimal text colors.
     Handles contrast inversion for Glass Mode (where Dark BG -> Light Glass).
+    Uses `precomputed` stats from analyze_regions() when given.
     """
-    cropped = image.crop(region)
-    gray = cropped.convert('L')
-    avg_luminance = np.mean(np.array(gray))
+    stats = precomputed or get_region_stats(image, region)
+    avg_luminance = stats['luminance']
     
     # Predict effective luminance for text contrast
     effective_luminance = avg_luminance
@@ -419,9 +696,7 @@ def get_adaptive_colors(image: Image.Image, region: tuple, use_glass: bool = Tru
         shadow = (0, 0, 0, 120)
 
     # Generate accent colors from dominant color
-    import colorsys
-    color_crop = cropped.convert('RGB').resize((30, 30))
-    dominant = tuple(map(int, np.mean(np.array(color_crop).reshape(-1, 3), axis=0)))
+    dominant = stats['dominant']
     
     r, g, b = [x / 255.0 for x in dominant]
     h, l, s = colorsys.rgb_to_hls(r, g, b)
@@ -451,20 +726,87 @@ def get_adaptive_colors(image: Image.Image, region: tuple, use_glass: bool = Tru
 # WIDGET RENDERERS - Resolution Independent
 # ============================================================================
 
+@lru_cache(maxsize=32)
+def _month_days(year: int, month: int) -> List[List[int]]:
+    """Weeks of a month (Sunday first, 0 = padding day). Shared - do not mutate."""
+    return calendar.Calendar(firstweekday=6).monthdayscalendar(year, month)
+
+
+def build_render_context(tasks: List[Dict], now: datetime = None) -> dict:
+    """
+    Shared per-generation state for all widget renderers.
+    
+    Returns:
+        {'now': datetime, 'month_days': weeks of the current month
+         (Sunday first), 'tasks_by_date': {'YYYY-MM-DD': [task, ...]},
+         'upcoming': [(days_from_today, task), ...] for yesterday..+7 days,
+         sorted by day, 'month_tasks': {day_of_month: [task, ...]} for
+         the current month}
+    """
+    if now is None:
+        now = datetime.now()
+    
+    tasks_by_date = {}
+    for t in tasks:
+        tasks_by_date.setdefault(t.get("date", ""), []).append(t)
+    
+    # Parse each distinct date once
+    today_date = now.date()
+    upcoming = []
+    month_tasks = {}
+    for date_str, date_tasks in tasks_by_date.items():
+        try:
+            task_date = date.fromisoformat(date_str)  # C parser, ~40x faster than strptime
+        except ValueError:
+            # Not zero-padded (e.g. "2026-10-5") - the GUI accepts anything
+            # strptime does, so fall back to it before giving up
+            try:
+                task_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            except ValueError:
+                continue
+        except TypeError:  # Missing/non-string date
+            continue
+        if task_date.year == now.year and task_date.month == now.month:
+            month_tasks.setdefault(task_date.day, []).extend(date_tasks)
+        delta = (task_date - today_date).days
+        if -1 <= delta <= 7:
+            upcoming.extend((delta, task) for task in date_tasks)
+    upcoming.sort(key=lambda x: x[0])
+    
+    return {
+        'now': now,
+        'month_days': _month_days(now.year, now.month),
+        'tasks_by_date': tasks_by_date,
+        'upcoming': upcoming,
+        'month_tasks': month_tasks,
+    }
+
+
+_WEEKDAY_LABELS = ("S", "M", "T", "W", "T", "F", "S")  # Sunday first, as _month_days
+_DAY_LABELS = tuple(str(d) for d in range(32))
+
+# 5x5 task-dot mask, stamped with a category color in the calendar grid
+_DOT_MASK = Image.new('L', (5, 5), 0)
+ImageDraw.Draw(_DOT_MASK).ellipse([0, 0, 4, 4], fill=255)
+
+
 def render_calendar_widget(base_image: Image.Image, tasks: List[Dict],
                            x: int, y: int, width: int, height: int,
-                           settings: dict, scale: dict, theme: dict) -> Tuple[Image.Image, tuple]:
+                           settings: dict, scale: dict, theme: dict,
+                           precomputed: dict = None, ctx: dict = None) -> Tuple[Image.Image, tuple]:
     """
     Render calendar with resolution-independent text.
     Font sizes are percentages of widget height.
     """
     region = (x, y, x + width, y + height)
     use_glass = settings.get('blend_mode', 'glass') == 'glass'
+    stats = precomputed or get_region_stats(base_image, region)
     
     # Create widget background
     if use_glass:
-        glass_params = get_optimal_glass_params(base_image, region)
+        glass_params = get_optimal_glass_params(stats['luminance'])
         widget = apply_glassmorphism(base_image, region, border_radius=scale['border_radius'],
+                                      source_key=ctx.get('source_key') if ctx else None,
                                       **glass_params)
     else:
         widget = apply_solid_background(width, height, theme, 
@@ -472,7 +814,7 @@ def render_calendar_widget(base_image: Image.Image, tasks: List[Dict],
                                          border_radius=scale['border_radius'])
     
     # Get AUTO-CONTRAST colors from actual background (with glass correction)
-    colors = get_adaptive_colors(base_image, region, use_glass)
+    colors = get_adaptive_colors(base_image, region, use_glass, stats)
     
     # For solid mode with light themes, override with theme colors
     if not use_glass:
@@ -492,7 +834,8 @@ def render_calendar_widget(base_image: Image.Image, tasks: List[Dict],
     
     padding = int(height * 0.04)  # 4% padding
     yp = padding
-    today_dt = datetime.now()
+    ctx = ctx or build_render_context(tasks)
+    today_dt = ctx['now']
     style = settings.get('calendar_style', 'aesthetic')
     user_scale = settings.get('calendar_font_scale', 100) / 100.0  # Convert 50-150% to 0.5-1.5
     
@@ -536,9 +879,7 @@ def render_calendar_widget(base_image: Image.Image, tasks: List[Dict],
     # === WEEKDAYS (4.5% of height) ===
     cell_w = (width - padding * 2) // 7
     wd_font = get_dynamic_font_size(height, 0.045, user_scale)
-    weekdays = ["S", "M", "T", "W", "T", "F", "S"]
-    
-    for i, wd in enumerate(weekdays):
+    for i, wd in enumerate(_WEEKDAY_LABELS):
         wx = padding + i * cell_w + cell_w // 2
         col = accent if i == 0 else text_secondary
         text_img = render_smooth_text(wd, wd_font, col, bold=True)
@@ -547,19 +888,13 @@ def render_calendar_widget(base_image: Image.Image, tasks: List[Dict],
     yp += int(wd_font * 1.6)
     
     # === CALENDAR GRID (5% of height per day) ===
-    cal_obj = calendar.Calendar(firstweekday=6)
-    month_days = cal_obj.monthdayscalendar(today_dt.year, today_dt.month)
-    
-    tasks_by_date = {}
-    for t in tasks:
-        d = t.get("date", "")
-        if d not in tasks_by_date:
-            tasks_by_date[d] = []
-        tasks_by_date[d].append(t)
+    month_days = ctx['month_days']
+    month_tasks = ctx['month_tasks']
     
     day_font = get_dynamic_font_size(height, 0.05, user_scale)
     cell_h = int(height * 0.08)
     max_weeks = 5 if style in ['compact', 'minimal'] else 6
+    dot_tiles = {}  # category -> solid color tile for the dot mask
     
     for week in month_days[:max_weeks]:
         for i, day in enumerate(week):
@@ -567,8 +902,7 @@ def render_calendar_widget(base_image: Image.Image, tasks: List[Dict],
                 continue
             
             cx = padding + i * cell_w + cell_w // 2
-            date_str = f"{today_dt.year}-{today_dt.month:02d}-{day:02d}"
-            has_tasks = date_str in tasks_by_date
+            day_tasks = month_tasks.get(day)
             
             # Today highlight
             if day == today_dt.day:
@@ -580,16 +914,20 @@ def render_calendar_widget(base_image: Image.Image, tasks: List[Dict],
             else:
                 day_text_col = text_color
             
-            text_img = render_smooth_text(str(day), day_font, day_text_col, bold=False)
-            widget.paste(text_img, (cx - text_img.width // 2, yp + 4), text_img)
+            tile = _text_tile(_DAY_LABELS[day], day_font, tuple(day_text_col))
+            widget.alpha_composite(tile, (cx - tile.width // 2, yp + 6))
             
-            # Task dots
-            if has_tasks and day != today_dt.day:
-                for j, task in enumerate(tasks_by_date[date_str][:2]):
+            # Task dots - stamp a prebuilt dot mask instead of rasterizing ellipses
+            if day_tasks and day != today_dt.day:
+                for j, task in enumerate(day_tasks[:2]):
                     cat = task.get("category", "default")
-                    dot_col = (*CATEGORY_COLORS.get(cat, (150, 150, 150)), 255)
+                    tile = dot_tiles.get(cat)
+                    if tile is None:
+                        tile = Image.new('RGBA', _DOT_MASK.size,
+                                         (*CATEGORY_COLORS.get(cat, (150, 150, 150)), 255))
+                        dot_tiles[cat] = tile
                     dx = cx - 3 + j * 6
-                    draw.ellipse([dx - 2, yp + day_font + 3, dx + 2, yp + day_font + 7], fill=dot_col)
+                    widget.paste(tile, (dx - 2, yp + day_font + 3), _DOT_MASK)
         
         yp += cell_h
     
@@ -598,14 +936,17 @@ def render_calendar_widget(base_image: Image.Image, tasks: List[Dict],
 
 def render_todo_widget(base_image: Image.Image, tasks: List[Dict],
                        x: int, y: int, width: int, height: int,
-                       settings: dict, scale: dict, theme: dict) -> Tuple[Image.Image, tuple]:
+                       settings: dict, scale: dict, theme: dict,
+                       precomputed: dict = None, ctx: dict = None) -> Tuple[Image.Image, tuple]:
     """Render To-Do with resolution-independent text."""
     region = (x, y, x + width, y + height)
     use_glass = settings.get('blend_mode', 'glass') == 'glass'
+    stats = precomputed or get_region_stats(base_image, region)
     
     if use_glass:
-        glass_params = get_optimal_glass_params(base_image, region)
+        glass_params = get_optimal_glass_params(stats['luminance'])
         widget = apply_glassmorphism(base_image, region, border_radius=scale['border_radius'],
+                                      source_key=ctx.get('source_key') if ctx else None,
                                       **glass_params)
     else:
         widget = apply_solid_background(width, height, theme,
@@ -613,7 +954,7 @@ def render_todo_widget(base_image: Image.Image, tasks: List[Dict],
                                          border_radius=scale['border_radius'])
     
     # Auto-contrast colors from actual background
-    colors = get_adaptive_colors(base_image, region, use_glass)
+    colors = get_adaptive_colors(base_image, region, use_glass, stats)
     text_color = colors['text']
     text_secondary = colors['text_secondary']
     shadow = colors['shadow']
@@ -632,18 +973,9 @@ def render_todo_widget(base_image: Image.Image, tasks: List[Dict],
     draw.line([(padding, yp), (width - padding, yp)], fill=(*text_secondary[:3], 60), width=1)
     yp += int(height * 0.025)
     
-    # Tasks (5% font size)
-    today_date = datetime.now().date()
-    upcoming = []
-    for task in tasks:
-        try:
-            task_date = datetime.strptime(task["date"], "%Y-%m-%d").date()
-            delta = (task_date - today_date).days
-            if -1 <= delta <= 7:
-                upcoming.append((delta, task))
-        except:
-            continue
-    upcoming.sort(key=lambda x: x[0])
+    # Tasks (5% font size) - window already built in the shared context
+    ctx = ctx or build_render_context(tasks)
+    upcoming = ctx['upcoming']
     
     body_font = get_dynamic_font_size(height, 0.055, user_scale)
     line_h = int(body_font * 1.6)
@@ -661,13 +993,9 @@ def render_todo_widget(base_image: Image.Image, tasks: List[Dict],
         
         # Checkbox removed as per user request
         
-        title = task.get("title", "")
-        # Adjusted padding since checkbox (cb_size) is gone
-        # Previous padding: padding + dot_size*2 + cb_size + 12
-        # New padding: padding + dot_size*2 + 12
-        max_chars = int((width - padding * 2 - dot_size * 2 - 20) / (body_font * 0.5))
-        if len(title) > max_chars:
-            title = title[:max_chars - 2] + ".."
+        # Measured fit in the space right of the dot (checkbox is gone)
+        title = fit_text(task.get("title", ""), body_font,
+                         width - padding * 2 - dot_size * 2 - 20)
         
         text_img = render_smooth_text(title, body_font, text_color, bold=False)
         widget.paste(text_img, (padding + dot_size * 2 + 12, yp - 1), text_img)
@@ -682,15 +1010,18 @@ def render_todo_widget(base_image: Image.Image, tasks: List[Dict],
 
 def render_notes_widget(base_image: Image.Image,
                         x: int, y: int, width: int, height: int,
-                        settings: dict, scale: dict, theme: dict) -> Tuple[Image.Image, tuple]:
+                        settings: dict, scale: dict, theme: dict,
+                        precomputed: dict = None, ctx: dict = None) -> Tuple[Image.Image, tuple]:
     """Render Notes with resolution-independent text."""
     region = (x, y, x + width, y + height)
     notes_text = load_notes()
     use_glass = settings.get('blend_mode', 'glass') == 'glass'
+    stats = precomputed or get_region_stats(base_image, region)
     
     if use_glass:
-        glass_params = get_optimal_glass_params(base_image, region)
+        glass_params = get_optimal_glass_params(stats['luminance'])
         widget = apply_glassmorphism(base_image, region, border_radius=scale['border_radius'],
+                                      source_key=ctx.get('source_key') if ctx else None,
                                       **glass_params)
     else:
         widget = apply_solid_background(width, height, theme,
@@ -698,7 +1029,7 @@ def render_notes_widget(base_image: Image.Image,
                                          border_radius=scale['border_radius'])
     
     # Auto-contrast colors
-    colors = get_adaptive_colors(base_image, region, use_glass)
+    colors = get_adaptive_colors(base_image, region, use_glass, stats)
     text_color = colors['text']
     text_secondary = colors['text_secondary']
     shadow = colors['shadow']
@@ -724,24 +1055,29 @@ def render_notes_widget(base_image: Image.Image,
         font = get_font(body_font, bold=False)
         lines = []
         max_w = width - padding * 2
+        line_h = int(body_font * 1.4)
+        max_lines = (height - yp - padding) // line_h
         
+        # Greedy wrap on accumulated advance widths - each word is measured
+        # once instead of re-measuring the whole line per appended word
+        space_w = font.getlength(" ")
         for para in notes_text.split('\n'):
-            words = para.split()
-            line = ""
-            for word in words:
-                test = line + " " + word if line else word
-                bbox = draw.textbbox((0, 0), test, font=font)
-                if bbox[2] - bbox[0] <= max_w:
-                    line = test
+            line_words = []
+            line_w = 0
+            for word in para.split():
+                word_w = font.getlength(word)
+                new_w = line_w + space_w + word_w if line_words else word_w
+                if new_w <= max_w or not line_words:
+                    line_words.append(word)
+                    line_w = new_w
                 else:
-                    if line:
-                        lines.append(line)
-                    line = word
-            if line:
-                lines.append(line)
-        
-        line_h = int(body_font * 1.4)
-        max_lines = (height - yp - padding) // line_h
+                    lines.append(" ".join(line_words))
+                    line_words = [word]
+                    line_w = word_w
+            if line_words:
+                lines.append(" ".join(line_words))
+            if len(lines) >= max_lines:
+                break
         
         for line in lines[:max_lines]:
             text_img = render_smooth_text(line, body_font, text_color, bold=False)
@@ -756,14 +1092,17 @@ def render_notes_widget(base_image: Image.Image,
 
 def render_clock_widget(base_image: Image.Image,
                         x: int, y: int, width: int, height: int,
-                        settings: dict, scale: dict, theme: dict) -> Tuple[Image.Image, tuple]:
+                        settings: dict, scale: dict, theme: dict,
+                        precomputed: dict = None, ctx: dict = None) -> Tuple[Image.Image, tuple]:
     """Render Clock with resolution-independent text."""
     region = (x, y, x + width, y + height)
     use_glass = settings.get('blend_mode', 'glass') == 'glass'
+    stats = precomputed or get_region_stats(base_image, region)
     
     if use_glass:
-        glass_params = get_optimal_glass_params(base_image, region)
+        glass_params = get_optimal_glass_params(stats['luminance'])
         widget = apply_glassmorphism(base_image, region, border_radius=scale['border_radius'],
+                                      source_key=ctx.get('source_key') if ctx else None,
                                       **glass_params)
     else:
         widget = apply_solid_background(width, height, theme,
@@ -771,13 +1110,14 @@ def render_clock_widget(base_image: Image.Image,
                                          border_radius=scale['border_radius'])
     
     # Auto-contrast colors
-    colors = get_adaptive_colors(base_image, region, use_glass)
+    colors = get_adaptive_colors(base_image, region, use_glass, stats)
     text_color = colors['text']
     shadow = colors['shadow']
     
     # Time text (50% of height for clock)
     user_scale = settings.get('clock_font_scale', 100) / 100.0
-    time_str = datetime.now().strftime("%H:%M")
+    now = ctx['now'] if ctx else datetime.now()
+    time_str = now.strftime("%H:%M")
     time_font = get_dynamic_font_size(height, 0.50, user_scale)
     
     text_img = render_smooth_text(time_str, time_font, text_color, bold=True, shadow_color=shadow)
@@ -807,63 +1147,158 @@ def get_widget_position(base_size: tuple, widget_size: tuple,
             max(padding, min(y, base_h - w_h - padding)))
 
 
+# Formats SystemParametersInfo loads without an optional Windows codec
+NATIVE_WALLPAPER_FORMATS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+RENDER_WORKERS = 4  # One thread per widget; Pillow releases the GIL in blur/resize/paste
+
+_last_render = None  # (input key, output path, output mtime_ns) of the last saved wallpaper
+
+
+def _render_key(base_image_path: str, tasks: List[Dict], settings: dict) -> Optional[tuple]:
+    """
+    Everything a generated wallpaper depends on. The clock only shows HH:MM,
+    so with it enabled the key rolls over every minute; otherwise daily.
+    """
+    try:
+        src = Path(base_image_path).stat()
+    except OSError:
+        return None
+    stamp = '%Y-%m-%d %H:%M' if settings.get('clock_enabled', False) else '%Y-%m-%d'
+    return (str(Path(base_image_path).resolve()), src.st_mtime_ns, src.st_size,
+            repr(tasks), repr(sorted(settings.items())), load_notes(),
+            datetime.now().strftime(stamp))
+
+
 def generate_wallpaper(base_image_path: str, tasks: List[Dict],
                        settings: dict = None) -> Optional[str]:
-    """Generate wallpaper with premium smooth text."""
+    """
+    Generate wallpaper with premium smooth text.
+    
+    If nothing it depends on has changed since the last call (same image
+    file, tasks, settings, notes, and date/minute), the previous output is
+    returned without re-rendering - e.g. Apply right after a live preview.
+    """
+    global _last_render
     if settings is None:
         settings = load_settings()
     
     try:
-        base_img = Image.open(base_image_path).convert('RGBA')
+        render_key = _render_key(base_image_path, tasks, settings)
+        if render_key is not None and _last_render and _last_render[0] == render_key:
+            _, last_path, last_mtime = _last_render
+            try:
+                if Path(last_path).stat().st_mtime_ns == last_mtime:
+                    return last_path
+            except OSError:
+                pass
+        
+        # Only the header is read here; pixels are decoded after layout
+        base_img = Image.open(base_image_path)
         base_w, base_h = base_img.size
         
         scale = calculate_dpi_scale(base_w, base_h)
         theme = get_theme(settings.get('theme', 'dark'))
-        result = base_img.copy()
+        
+        # Layout pass: (x, y, w, h) for every enabled widget
+        layout = {}
         
         # Calendar
         if settings.get("calendar_enabled", True):
             size_pct = settings.get("calendar_size_percent", 25)
-            cal_w, cal_h = calculate_widget_size(base_w, base_h, 'calendar', size_pct)
+            cal_w, cal_h = calculate_widget_size(base_w, base_h, 'calendar', size_pct, scale)
             x, y = get_widget_position((base_w, base_h), (cal_w, cal_h),
                                         settings.get("calendar_x_percent", 0),
                                         settings.get("calendar_y_percent", 0))
-            widget, pos = render_calendar_widget(result, tasks, x, y, cal_w, cal_h, settings, scale, theme)
-            result.paste(widget, pos, widget)
+            layout['calendar'] = (x, y, cal_w, cal_h)
         
         # To-Do
         if settings.get("todo_enabled", True):
             size_pct = settings.get("todo_width_percent", 22)
-            todo_w, todo_h = calculate_widget_size(base_w, base_h, 'todo', size_pct)
+            todo_w, todo_h = calculate_widget_size(base_w, base_h, 'todo', size_pct, scale)
             x, y = get_widget_position((base_w, base_h), (todo_w, todo_h),
                                         settings.get("todo_x_percent", 0),
                                         settings.get("todo_y_percent", 55))
-            widget, pos = render_todo_widget(result, tasks, x, y, todo_w, todo_h, settings, scale, theme)
-            result.paste(widget, pos, widget)
+            layout['todo'] = (x, y, todo_w, todo_h)
         
         # Notes
         if settings.get("notes_enabled", True):
             size_pct = settings.get("notes_width_percent", 22)
-            notes_w, notes_h = calculate_widget_size(base_w, base_h, 'notes', size_pct)
+            notes_w, notes_h = calculate_widget_size(base_w, base_h, 'notes', size_pct, scale)
             x, y = get_widget_position((base_w, base_h), (notes_w, notes_h),
                                         settings.get("notes_x_percent", 75),
                                         settings.get("notes_y_percent", 60))
-            widget, pos = render_notes_widget(result, x, y, notes_w, notes_h, settings, scale, theme)
-            result.paste(widget, pos, widget)
+            layout['notes'] = (x, y, notes_w, notes_h)
         
         # Clock
         if settings.get("clock_enabled", False):
             size_pct = settings.get("clock_size_percent", 15)
-            clock_w, clock_h = calculate_widget_size(base_w, base_h, 'clock', size_pct)
+            clock_w, clock_h = calculate_widget_size(base_w, base_h, 'clock', size_pct, scale)
             x, y = get_widget_position((base_w, base_h), (clock_w, clock_h),
                                         settings.get("clock_x_percent", 80),
                                         settings.get("clock_y_percent", 5))
-            widget, pos = render_clock_widget(result, x, y, clock_w, clock_h, settings, scale, theme)
+            layout['clock'] = (x, y, clock_w, clock_h)
+        
+        # Nothing to draw - the source image is the wallpaper, skip decode/encode
+        # (other formats, e.g. WebP, still get re-encoded to PNG below)
+        if not layout and Path(base_image_path).suffix.lower() in NATIVE_WALLPAPER_FORMATS:
+            return str(base_image_path)
+        
+        # Opaque RGB base; only the widget sprites carry alpha. Most sources
+        # (JPEG, 24-bit PNG) already are RGB - convert() would just copy them
+        if base_img.mode != 'RGB':
+            base_img = base_img.convert('RGB')
+        else:
+            base_img.load()
+        
+        # Luminance/dominant color for all widgets from one downsampled copy
+        stats = analyze_regions(base_img, {name: (x, y, x + w, y + h)
+                                           for name, (x, y, w, h) in layout.items()})
+        
+        # One clock reading, month table and task index shared by every widget;
+        # the source file identity lets unchanged glass panels be reused
+        ctx = build_render_context(tasks)
+        ctx['source_key'] = render_key[:3] if render_key else None
+        
+        # Render pass - widgets only read base_img, so they render in parallel
+        jobs = []
+        if 'calendar' in layout:
+            x, y, w, h = layout['calendar']
+            jobs.append((render_calendar_widget,
+                         (base_img, tasks, x, y, w, h, settings, scale, theme), stats['calendar']))
+        if 'todo' in layout:
+            x, y, w, h = layout['todo']
+            jobs.append((render_todo_widget,
+                         (base_img, tasks, x, y, w, h, settings, scale, theme), stats['todo']))
+        if 'notes' in layout:
+            x, y, w, h = layout['notes']
+            jobs.append((render_notes_widget,
+                         (base_img, x, y, w, h, settings, scale, theme), stats['notes']))
+        if 'clock' in layout:
+            x, y, w, h = layout['clock']
+            jobs.append((render_clock_widget,
+                         (base_img, x, y, w, h, settings, scale, theme), stats['clock']))
+        
+        with ThreadPoolExecutor(max_workers=RENDER_WORKERS) as pool:
+            futures = [pool.submit(fn, *args, precomputed=pre, ctx=ctx) for fn, args, pre in jobs]
+            rendered = [future.result() for future in futures]
+        
+        # Every widget has finished sampling the clean base_img, so paste
+        # straight onto it - no full-size canvas copy, and overlapping widgets
+        # still never blur each other. Submission order is the stacking order
+        # (clock on top).
+        result = base_img
+        for widget, pos in rendered:
             result.paste(widget, pos, widget)
         
         output_path = OUTPUT_DIR / WALLPAPER_CONFIG["output_filename"]
-        result.save(output_path, "PNG", quality=WALLPAPER_CONFIG["quality"])
+        # zlib level is what costs time on a 4K save.
+        # Z_RLE only matches runs, which is what PNG's row filters leave in a
+        # photo - faster than the default strategy and a smaller file here.
+        result.save(output_path, "PNG", compress_level=WALLPAPER_CONFIG["compress_level"],
+                    compress_type=zlib.Z_RLE, optimize=False)
         
+        _last_render = (render_key, str(output_path), output_path.stat().st_mtime_ns) if render_key else None
         return str(output_path)
     
     except Exception as e:
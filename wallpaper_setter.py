@@ -2,7 +2,8 @@
 Windows Wallpaper Setter - Sets desktop wallpaper using Windows API
 """
 import ctypes
-from pathlib import Path
+from ctypes import wintypes
+from functools import lru_cache
 import os
 
 
@@ -12,6 +13,19 @@ SPIF_UPDATEINIFILE = 0x01
 SPIF_SENDCHANGE = 0x02
 
 
+@lru_cache(maxsize=1)
+def _system_parameters_info():
+    """
+    SystemParametersInfoW resolved once, with its prototype declared so
+    ctypes converts the arguments directly instead of guessing per call.
+    """
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    spi = user32.SystemParametersInfoW
+    spi.argtypes = (wintypes.UINT, wintypes.UINT, wintypes.LPCWSTR, wintypes.UINT)
+    spi.restype = wintypes.BOOL
+    return spi
+
+
 def set_wallpaper(image_path: str) -> bool:
     """
     Set the Windows desktop wallpaper
@@ -24,7 +38,7 @@ def set_wallpaper(image_path: str) -> bool:
     """
     try:
         # Ensure absolute path
-        abs_path = str(Path(image_path).absolute())
+        abs_path = os.path.abspath(image_path)
         
         # Verify file exists
         if not os.path.exists(abs_path):
@@ -32,13 +46,15 @@ def set_wallpaper(image_path: str) -> bool:
             return False
         
         # Use Windows API to set wallpaper
-        result = ctypes.windll.user32.SystemParametersInfoW(
+        result = _system_parameters_info()(
             SPI_SETDESKWALLPAPER,
             0,
             abs_path,
             SPIF_UPDATEINIFILE | SPIF_SENDCHANGE
         )
         
+        if not result:
+            print(f"SystemParametersInfoW failed: {ctypes.FormatError(ctypes.get_last_error())}")
         return bool(result)
     
     except Exception as e:
@@ -60,7 +76,7 @@ def get_current_wallpaper() -> str:
             winreg.HKEY_CURRENT_USER,
             r"Control Panel\Desktop",
             0,
-            winreg.KEY_READ
+            winreg.KEY_QUERY_VALUE
         )
         
         value, _ = winreg.QueryValueEx(key, "Wallpaper")